@@ -0,0 +1,59 @@
+"""compact_figure: smaller payloads that render the same data and styling."""
+import base64
+import json
+import os
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+
+def _figure():
+    rng = np.random.default_rng(7)
+    fig = go.Figure(go.Scatter(x=rng.random(200) * 100, y=rng.random(200), mode='markers'))
+    fig.add_trace(go.Bar(x=list("abcdefghij"), y=np.arange(10) * 1_000_003.0, yaxis='y2'))
+    fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      font=dict(color='#94a3b8', size=13),
+                      xaxis=dict(gridcolor='rgba(255,255,255,0.05)', tickangle=-30),
+                      yaxis2=dict(gridcolor='rgba(255,255,255,0.05)', overlaying='y', side='right'),
+                      title="t")
+    return fig
+
+
+def _values(v):
+    if isinstance(v, dict):      # plotly >= 6 base64 typed array
+        return np.frombuffer(base64.b64decode(v['bdata']), dtype=v['dtype']).astype(float)
+    return np.asarray(v, dtype=float)
+
+
+def test_round_trip_values():
+    fig = _figure()
+    back = json.loads(app.compact_figure(_figure()).to_json())['data']
+    np.testing.assert_allclose(_values(back[0]['x']), fig.data[0].x, rtol=1e-6)
+    np.testing.assert_allclose(_values(back[0]['y']), fig.data[0].y, rtol=1e-6)
+    np.testing.assert_array_equal(_values(back[1]['y']), fig.data[1].y)
+    assert list(back[1]['x']) == list("abcdefghij")
+
+
+def test_template_defaults_dropped_but_overrides_kept():
+    layout = json.loads(app.compact_figure(_figure()).to_json())['layout']
+    for k in ('paper_bgcolor', 'plot_bgcolor'):
+        assert k not in layout
+    assert layout['font'] == {'size': 13}
+    assert layout['xaxis'] == {'tickangle': -30}
+    assert layout['yaxis2'] == {'overlaying': 'y', 'side': 'right'}
+    assert layout['title']['text'] == "t"
+    assert layout['template']['layout']['paper_bgcolor'] == 'rgba(0,0,0,0)'
+
+
+def test_smaller_than_uncompacted():
+    assert len(app.compact_figure(_figure()).to_json()) < len(_figure().to_json())
+
+
+def test_template_none_keeps_layout():
+    layout = app.compact_figure(_figure(), template=None).layout
+    assert layout.paper_bgcolor == 'rgba(0,0,0,0)'
@@ -0,0 +1,44 @@
+"""correlation_matrix against pandas .corr() on the sample dataset."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+DATA = os.path.join(os.path.dirname(__file__), os.pardir, "data", "Student_360_View.csv")
+
+
+@pytest.fixture(scope="module")
+def base():
+    df, _ = app.apply_universal_column_mapping(pd.read_csv(DATA))
+    health = app.ingest_dataset_health(df)
+    return health['fingerprint'], df
+
+
+def _assert_matches_pandas(frame, base):
+    cols = list(frame.select_dtypes(include='number').columns)
+    got = app.correlation_matrix(frame, cols, base=base)
+    want = frame[cols].corr()
+    np.testing.assert_allclose(got.to_numpy(), want.to_numpy(), atol=1e-9, equal_nan=True)
+
+
+def test_full_view(base):
+    _assert_matches_pandas(base[1], base)
+
+
+def test_constant_columns_are_nan(base):
+    df = base[1]
+    view = df[df['cumulative_gpa'] == 3.45]
+    assert len(view) > 1
+    _assert_matches_pandas(view, base)
+    got = app.correlation_matrix(view, base=base)
+    assert got.loc['cumulative_gpa'].isna().all()
+
+
+def test_direct_path_constant_column():
+    frame = pd.DataFrame({'a': [1.0, 2.0, 3.0, 4.0], 'b': [7.1] * 4, 'c': [4.0, 3.0, 2.5, 1.0]})
+    _assert_matches_pandas(frame, None)
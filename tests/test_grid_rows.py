@@ -0,0 +1,59 @@
+"""grid_row_order sorts and filters like the equivalent pandas expression."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+
+@pytest.fixture(scope="module")
+def frame():
+    rng = np.random.default_rng(11)
+    n = 300
+    df = pd.DataFrame({
+        'college': rng.choice(['Arts', 'Law', 'Science', None], n),
+        'year': rng.integers(1, 5, n),
+        'balance': rng.normal(500, 200, n).round(2),
+        'mixed': pd.Series([['x', 'y', 3, 7.5][i] for i in rng.integers(0, 4, n)], dtype=object),
+    })
+    df.index = pd.RangeIndex(1000, 1000 + n)
+    df.loc[df.sample(20, random_state=1).index, 'balance'] = np.nan
+    return df
+
+
+def test_unsorted_unfiltered(frame):
+    np.testing.assert_array_equal(app.grid_row_order(frame, None, True, ()), np.arange(len(frame)))
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort_missing_last(frame, ascending):
+    order = app.grid_row_order(frame, 'balance', ascending, ())
+    want = frame.reset_index(drop=True)['balance'].sort_values(
+        ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    np.testing.assert_array_equal(order, want)
+    assert frame['balance'].iloc[order[-20:]].isna().all()
+
+
+def test_sort_mixed_types(frame):
+    order = app.grid_row_order(frame, 'mixed', True, ())
+    assert sorted(order) == list(range(len(frame)))
+    labels = frame['mixed'].astype(str).iloc[order].tolist()
+    assert labels == sorted(labels)
+
+
+def test_filters(frame):
+    filters = (('college', 'in', ('Arts', 'Law', 'missing-label')), ('balance', 'range', (400.0, 600.0)))
+    order = app.grid_row_order(frame, 'year', False, filters)
+    flat = frame.reset_index(drop=True)
+    mask = flat['college'].isin(['Arts', 'Law']) & flat['balance'].between(400.0, 600.0)
+    want = flat['year'].sort_values(ascending=False, kind='stable').index
+    np.testing.assert_array_equal(order, want[mask[want]].to_numpy())
+
+
+def test_in_filter_on_numbers(frame):
+    order = app.grid_row_order(frame, None, True, (('year', 'in', ('2', '4')),))
+    np.testing.assert_array_equal(order, np.flatnonzero(frame['year'].isin([2, 4]).to_numpy()))
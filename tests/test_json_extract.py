@@ -0,0 +1,37 @@
+"""_scan_balanced_json / extract_json_from_response on messy LLM output."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('text {not json {"a":1} } end', {"a": 1}),
+    ('text {not json {"a":1} end', {"a": 1}),
+    ('a {"x": [1, 2} {"c":3}', {"c": 3}),
+    ('x {"a": "}{"} y', {"a": "}{"}),
+    ('[1,2] {"b":2}', {"b": 2}),
+    ('[[1]]', [[1]]),
+    ('no json here', None),
+    ('{x {y {"a": {"b": 1}} z', {"a": {"b": 1}}),
+    ('{"a": 1] tail', None),
+])
+def test_scan_balanced_json(text, expected):
+    assert app._scan_balanced_json(text) == expected
+
+
+@pytest.mark.parametrize("noise", [
+    '{' * 20000,
+    '{ [' * 20000,
+    '{"k": [1, 2} ' * 20000,
+    ']}' * 20000,
+])
+def test_late_object_after_long_noise(noise):
+    assert app._scan_balanced_json(noise + ' {"late": true} tail') == {"late": True}
+
+
+def test_unbalanced_noise_alone():
+    assert app._scan_balanced_json('{' * 3000 + 'x') is None
@@ -0,0 +1,92 @@
+"""build_pivot agrees with pandas.pivot_table; partial-sum std stays exact."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+
+@pytest.fixture(scope="module")
+def frame():
+    rng = np.random.default_rng(7)
+    n = 400
+    df = pd.DataFrame({
+        'region': rng.choice(['North', 'South', 'East'], n),
+        'product': rng.choice(['A', 'B', 'C', 'D'], n),
+        'channel': rng.choice(['web', 'store'], n),
+        'sales': rng.normal(1000, 250, n),
+        'units': rng.integers(1, 50, n).astype(float),
+    })
+    df.loc[rng.choice(n, 30, replace=False), 'units'] = np.nan
+    return df
+
+
+def _expected(df, rows, cols, metrics, agg):
+    func = {'p25': lambda s: s.quantile(0.25), 'p75': lambda s: s.quantile(0.75),
+            'p90': lambda s: s.quantile(0.9)}.get(agg, agg)
+    return pd.pivot_table(df, index=rows, columns=cols or None, values=metrics, aggfunc=func)
+
+
+@pytest.mark.parametrize("agg", app.PIVOT_AGGS)
+def test_matches_pivot_table(frame, agg):
+    rows, cols, metrics = ['region', 'channel'], ['product'], ['sales', 'units']
+    got = app.build_pivot(frame, rows, cols, metrics, agg, totals=False)
+    want = _expected(frame, rows, cols, metrics, agg)
+    assert got.shape == want.shape
+    for (metric, product) in want.columns:
+        for (region, channel), value in want[(metric, product)].items():
+            assert got.loc[(region, channel), (metric, product)] == pytest.approx(value, nan_ok=True)
+
+
+def test_totals(frame):
+    got = app.build_pivot(frame, ['region', 'channel'], ['product'], ['sales'], 'mean')
+    total = (app.PIVOT_TOTAL, app.PIVOT_TOTAL)
+    assert got.index[-1] == total
+    assert got.loc[total, ('sales', app.PIVOT_TOTAL)] == pytest.approx(frame['sales'].mean())
+    north = frame[frame['region'] == 'North']
+    assert got.loc[('North', app.PIVOT_TOTAL), ('sales', 'B')] == pytest.approx(
+        north.loc[north['product'] == 'B', 'sales'].mean())
+    # subtotals follow their group, the grand total comes last
+    labels = list(got.index)
+    assert labels.index(('North', app.PIVOT_TOTAL)) > labels.index(('North', 'web'))
+    assert labels.index(('North', app.PIVOT_TOTAL)) < labels.index(('South', 'store'))
+
+
+def test_no_columns(frame):
+    got = app.build_pivot(frame, ['region'], [], ['sales'], 'sum', totals=False)
+    want = frame.groupby('region')['sales'].sum()
+    assert list(got.columns) == ['sales']
+    np.testing.assert_allclose(got['sales'].to_numpy(), want.to_numpy())
+
+
+def test_std_large_offset():
+    # values near 1e9 with unit spread: a naive sum-of-squares variance loses every digit
+    v = 1e9 + np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    df = pd.DataFrame({'g': ['x', 'x', 'x', 'y', 'y', 'z'], 'v': v})
+    partials, shift = app._pivot_partials(df, ('g',), 'v')
+    std = app._pivot_finish(app._pivot_level(partials, ['g']), 'std', shift)
+    want = df.groupby('g')['v'].std()
+    assert std['x'] == pytest.approx(want['x'], rel=1e-9)
+    assert std['y'] == pytest.approx(want['y'], rel=1e-9)
+    assert np.isnan(std['z'])                      # one value: undefined, as in pandas
+    total = app._pivot_finish(app._pivot_level(partials, []), 'std', shift)
+    assert total.iloc[0] == pytest.approx(df['v'].std(), rel=1e-9)
+
+
+def test_dimensions_skip_identifiers():
+    n = 60
+    df = pd.DataFrame({
+        'student_id': range(n),
+        'roll_no': range(1000, 1000 + n),
+        'email': [f"s{i}@uni.test" for i in range(n)],
+        'college': ['Arts', 'Science', 'Law'] * (n // 3),
+        'year': [1, 2, 3, 4] * (n // 4),
+        'fee': np.linspace(100, 200, n),
+    })
+    dims = app.pivot_dimensions(df)
+    assert 'college' in dims and 'year' in dims
+    assert not {'student_id', 'roll_no', 'email'} & set(dims)
@@ -0,0 +1,35 @@
+"""report_cache_key: one artefact per dataset, full filter state and options."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+
+def _sig(**overrides):
+    state = {k: None for k in app.FILTER_STATE_KEYS}
+    state.update(overrides)
+    return str(state)
+
+
+def test_stable():
+    assert app.report_cache_key("fp", _sig(), True, "None") == app.report_cache_key("fp", _sig(), True, "None")
+
+
+@pytest.mark.parametrize("other", [
+    ("fp2", _sig(), True, "None"),
+    ("fp", _sig(fin_filter_aid_range=(0.0, 5000.0)), True, "None"),
+    ("fp", _sig(fin_filter_gpa=(2.04, 4.0)), True, "None"),
+    ("fp", _sig(), False, "None"),
+    ("fp", _sig(), True, "gzip"),
+])
+def test_every_input_changes_the_key(other):
+    assert app.report_cache_key(*other) != app.report_cache_key("fp", _sig(), True, "None")
+
+
+def test_fine_gpa_ranges_differ():
+    a = app.report_cache_key("fp", _sig(fin_filter_gpa=(2.04, 4.0)), True, "None")
+    b = app.report_cache_key("fp", _sig(fin_filter_gpa=(2.01, 4.0)), True, "None")
+    assert a != b
@@ -0,0 +1,47 @@
+"""segment_kpis agrees with compute_financial_kpis run on each segment's rows."""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+app = pytest.importorskip("app_financial_v4")
+
+DATA = os.path.join(os.path.dirname(__file__), os.pardir, "data", "Student_360_View.csv")
+
+
+@pytest.fixture(scope="module")
+def frame():
+    df, _ = app.apply_universal_column_mapping(pd.read_csv(DATA))
+    return df, app.detect_financial_columns(df)
+
+
+def _same(a, b):
+    if isinstance(a, pd.Series):
+        pd.testing.assert_series_equal(a, b, check_names=False, check_index_type=False)
+    elif isinstance(a, dict):
+        assert a.keys() == b.keys()
+        np.testing.assert_allclose(list(a.values()), list(b.values()))
+    elif isinstance(a, float) and np.isnan(a):
+        assert np.isnan(b)
+    else:
+        assert a == pytest.approx(b)
+
+
+@pytest.mark.parametrize("dimension", [d for d in app.SEGMENT_DIMENSIONS])
+def test_matches_per_segment_kpis(frame, dimension):
+    df, col_roles = frame
+    if dimension not in df.columns:
+        pytest.skip(f"{dimension} not in sample data")
+    segments, _, _ = app.plan_segments(df, dimension)
+    grouped = app.segment_kpis(df, dimension, col_roles, [seg for seg, _ in segments])
+    assert set(grouped) == {seg for seg, _ in segments}
+    for seg, seg_df in segments:
+        want = app.compute_financial_kpis(seg_df, col_roles)
+        got = grouped[seg]
+        prompt_keys = {k for _, keys in app._PROMPT_KPI_TIERS for k in keys} | {'top_products'}
+        assert {k for k in prompt_keys if k in want} <= set(got)
+        for k, v in got.items():
+            _same(v, want[k])